@@ -1,12 +1,39 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import math
 import random
+import threading
+import time
 import tkinter as tk
-from typing import Callable
+from typing import Callable, NamedTuple
 
-from emotion_lava_lamp import EmotionLavaLampEngine, VAD, clamp
+import numpy as np
+
+from emotion_lava_lamp import EmotionLavaLampEngine, VAD, VisualParams, clamp
+
+_HEX = [f"{i:02x}" for i in range(256)]
+
+BACKGROUND = (0x0F, 0x0F, 0x16)
+LAMP_OUTLINE = (0x6C, 0x6C, 0x8A)
+LABEL_TEXT = (0xE6, 0xE6, 0xF0)
+
+# Redraw only when the smoothed state or a blob moves by more than this; poll slower while idle.
+STATE_EPSILON = 1e-3
+MOTION_EPSILON_PX = 0.5
+IDLE_INTERVAL_MS = 50
+
+
+def hex_color(rgb: tuple[int, int, int] | np.ndarray) -> str:
+    """Tk colour string for a uint8 RGB triplet."""
+    return "#" + _HEX[rgb[0]] + _HEX[rgb[1]] + _HEX[rgb[2]]
+
+
+@functools.lru_cache(maxsize=256)
+def _tile_axes(w: int, h: int) -> tuple[np.ndarray, np.ndarray]:
+    """Pixel offsets of a ``w`` x ``h`` tile as broadcastable row/column vectors."""
+    return np.arange(w, dtype=np.float64)[None, :], np.arange(h, dtype=np.float64)[:, None]
 
 
 class VADSignal:
@@ -43,6 +70,55 @@ class VADSignal:
         raise ValueError(f"unknown mode: {self.mode}")
 
 
+class FrameSnapshot(NamedTuple):
+    params: VisualParams
+    pos: np.ndarray
+    radius: np.ndarray
+    color: np.ndarray
+    vad: VAD
+    energy: float
+
+
+class EngineWorker(threading.Thread):
+    """Ticks the engine at a fixed rate off the UI thread and publishes the latest frame."""
+
+    def __init__(self, engine: EmotionLavaLampEngine, dt: float = 0.016) -> None:
+        super().__init__(name="engine-worker", daemon=True)
+        self.engine = engine
+        self.dt = dt
+        self._lock = threading.Lock()
+        self._front: FrameSnapshot | None = None
+        self._stopped = threading.Event()
+
+    def latest(self) -> FrameSnapshot | None:
+        with self._lock:
+            return self._front
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def run(self) -> None:
+        engine = self.engine
+        next_tick = time.perf_counter()
+        while not self._stopped.is_set():
+            params = engine.tick(self.dt)
+            sim = engine.sim
+            # Each snapshot gets fresh arrays: the UI may still be rasterizing the previous one.
+            back = FrameSnapshot(
+                params, sim.pos.copy(), sim.radius.copy(), sim.color.copy(),
+                engine.filter.state, engine.energy_model.energy,
+            )
+            with self._lock:
+                self._front = back
+
+            next_tick += self.dt
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                self._stopped.wait(delay)
+            else:
+                next_tick = time.perf_counter()
+
+
 class LavaLampApp:
     def __init__(self, vad_getter: Callable[[], VAD], width: int = 540, height: int = 760) -> None:
         self.width = width
@@ -50,47 +126,111 @@ class LavaLampApp:
         self.dt = 0.016
 
         self.engine = EmotionLavaLampEngine(vad_getter=vad_getter)
+        self.worker = EngineWorker(self.engine, self.dt)
 
         self.root = tk.Tk()
         self.root.title("Emotion Lava Lamp (VAD)")
-        self.canvas = tk.Canvas(self.root, width=self.width, height=self.height, bg="#0f0f16", highlightthickness=0)
+        self.canvas = tk.Canvas(
+            self.root, width=self.width, height=self.height, bg=hex_color(BACKGROUND), highlightthickness=0
+        )
         self.canvas.pack()
 
-        self.label = tk.Label(self.root, text="", anchor="w", justify="left", bg="#0f0f16", fg="#e6e6f0")
+        self.label = tk.Label(
+            self.root, text="", anchor="w", justify="left", bg=hex_color(BACKGROUND), fg=hex_color(LABEL_TEXT)
+        )
         self.label.pack(fill="x")
 
-    def _draw(self) -> None:
-        params = self.engine.tick(self.dt)
-        blobs = self.engine.sim.blobs
-
-        self.canvas.delete("all")
+        # Blobs are rasterized into an RGB array and pushed to whichever of the two photo images is
+        # not on screen; flipping is a single itemconfigure on the canvas image.
+        self.margin = 48
+        self._background = np.array(BACKGROUND, dtype=np.uint8)
+        self._frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self._ppm_header = b"P6 %d %d 255 " % (self.width, self.height)
+        self._buffers = [tk.PhotoImage(width=self.width, height=self.height) for _ in range(2)]
+        self._back = 0
+        self._last_drawn: FrameSnapshot | None = None
+        self.image_id = self.canvas.create_image(0, 0, anchor="nw", image=self._buffers[1])
 
         # Lamp body
-        margin = 48
-        self.canvas.create_rectangle(margin, margin, self.width - margin, self.height - margin, outline="#6c6c8a", width=2)
-
-        for blob in blobs:
-            x = margin + blob.position[0] * (self.width - margin * 2)
-            y = margin + (1.0 - blob.position[1]) * (self.height - margin * 2)
-            r = blob.radius * min(self.width, self.height) * 0.35
-            rgb = tuple(max(0, min(255, int(c * 255))) for c in blob.color)
-            color = f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
-            self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=color, outline="")
-
-        s = self.engine.filter.state
-        self.label.configure(
-            text=(
-                f"Smoothed VAD: V={s[0]:+.2f}, A={s[1]:+.2f}, D={s[2]:+.2f}   "
-                f"Energy={self.engine.energy_model.energy:.3f}   "
-                f"Blobs={len(blobs)}   Turb={params.turbulence:.2f}"
-            )
+        self.canvas.create_rectangle(
+            self.margin,
+            self.margin,
+            self.width - self.margin,
+            self.height - self.margin,
+            outline=hex_color(LAMP_OUTLINE),
+            width=2,
         )
 
-        self.root.after(int(self.dt * 1000), self._draw)
+    def _render(self, pos: np.ndarray, radius: np.ndarray, color: np.ndarray) -> None:
+        margin = self.margin
+        cx = margin + pos[:, 0] * (self.width - margin * 2)
+        cy = margin + (1.0 - pos[:, 1]) * (self.height - margin * 2)
+        r = radius * min(self.width, self.height) * 0.35
+
+        frame = self._frame
+        frame[:] = self._background
+        # Each disc only touches the pixels of its own bounding box.
+        for x, y, rr, c in zip(cx.tolist(), cy.tolist(), r.tolist(), color):
+            x0, x1 = max(0, int(x - rr)), min(self.width, int(x + rr) + 1)
+            y0, y1 = max(0, int(y - rr)), min(self.height, int(y + rr) + 1)
+            if x0 >= x1 or y0 >= y1:
+                continue
+            xs, ys = _tile_axes(x1 - x0, y1 - y0)
+            tile = frame[y0:y1, x0:x1]
+            tile[(xs + (x0 - x)) ** 2 + (ys + (y0 - y)) ** 2 < rr * rr] = c
+
+        buf = self._buffers[self._back]
+        self.root.tk.call(buf, "put", self._ppm_header + frame.tobytes(), "-format", "ppm")
+        self.canvas.itemconfigure(self.image_id, image=buf)
+        self._back ^= 1
+
+    def _changed(self, frame: FrameSnapshot) -> bool:
+        """Whether ``frame`` differs visibly from the last frame drawn."""
+        last = self._last_drawn
+        if last is None or len(frame.radius) != len(last.radius):
+            return True
+        if abs(frame.energy - last.energy) >= STATE_EPSILON:
+            return True
+        if max(abs(a - b) for a, b in zip(frame.vad, last.vad)) >= STATE_EPSILON:
+            return True
+        if len(frame.radius):
+            px_per_unit = max(self.width, self.height)
+            if np.abs(frame.pos - last.pos).max() * px_per_unit >= MOTION_EPSILON_PX:
+                return True
+            if np.abs(frame.radius - last.radius).max() * px_per_unit >= MOTION_EPSILON_PX:
+                return True
+        return not np.array_equal(frame.color, last.color)
+
+    def _draw(self) -> None:
+        frame = self.worker.latest()
+        interval_ms = int(self.dt * 1000)
+        # A frame we already drew only means the worker has not published yet, so keep the tick rate;
+        # back off only when a new frame turns out to be visually static.
+        if frame is not None and frame is not self._last_drawn:
+            if self._changed(frame):
+                self._last_drawn = frame
+                self._render(frame.pos, frame.radius, frame.color)
+
+                s = frame.vad
+                self.label.configure(
+                    text=(
+                        f"Smoothed VAD: V={s[0]:+.2f}, A={s[1]:+.2f}, D={s[2]:+.2f}   "
+                        f"Energy={frame.energy:.3f}   "
+                        f"Blobs={len(frame.radius)}   Turb={frame.params.turbulence:.2f}"
+                    )
+                )
+            else:
+                interval_ms = IDLE_INTERVAL_MS
+
+        self.root.after(interval_ms, self.root.after_idle, self._draw)
 
     def run(self) -> None:
-        self._draw()
-        self.root.mainloop()
+        self.worker.start()
+        try:
+            self._draw()
+            self.root.mainloop()
+        finally:
+            self.worker.stop()
 
 
 def main() -> None:
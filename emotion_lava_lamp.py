@@ -1,13 +1,39 @@
 from __future__ import annotations
 
+import functools
 import math
-import random
 from dataclasses import dataclass, field
 from typing import Callable, Iterable
 
+import numpy as np
+
+try:
+    from numba import njit
+
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - optional accelerator
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+
+        return wrap
+
 
 VAD = tuple[float, float, float]
 
+# Module-level aliases for math functions used on the per-tick Python path (saves attribute lookups).
+_TAU = math.tau
+_SIN = math.sin
+_EXP = math.exp
+_SQRT2 = math.sqrt(2.0)
+_ONE_THIRD = 1.0 / 3.0
+
+# Up to this many blobs the merge pass tests all pairs directly instead of building the grid;
+# the crossover is much higher when the grid kernel runs as plain Python.
+_ALL_PAIRS_MAX_BLOBS = 128 if _HAVE_NUMBA else 512
+
 
 def clamp(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
@@ -18,23 +44,37 @@ def lerp(a: float, b: float, t: float) -> float:
 
 
 def hsv_to_rgb(h: float, s: float, v: float) -> tuple[float, float, float]:
-    h = h % 360.0
-    c = v * s
-    x = c * (1 - abs((h / 60.0) % 2 - 1))
-    m = v - c
-    if h < 60:
-        rp, gp, bp = c, x, 0
-    elif h < 120:
-        rp, gp, bp = x, c, 0
-    elif h < 180:
-        rp, gp, bp = 0, c, x
-    elif h < 240:
-        rp, gp, bp = 0, x, c
-    elif h < 300:
-        rp, gp, bp = x, 0, c
-    else:
-        rp, gp, bp = c, 0, x
-    return rp + m, gp + m, bp + m
+    # Branchless form: channel n is v - v*s*clamp(min(k, 4 - k), 0, 1) with k = (n + h/60) mod 6.
+    # Scalar only: all blobs take the mapper's single colour, so there is no per-blob HSV to vectorize.
+    h60 = (h / 60.0) % 6.0
+    vs = v * s
+    k = (h60 + 5.0) % 6.0
+    r = v - vs * max(0.0, min(1.0, k, 4.0 - k))
+    k = (h60 + 3.0) % 6.0
+    g = v - vs * max(0.0, min(1.0, k, 4.0 - k))
+    k = (h60 + 1.0) % 6.0
+    b = v - vs * max(0.0, min(1.0, k, 4.0 - k))
+    return r, g, b
+
+
+@functools.lru_cache(maxsize=4096)
+def _hsv_to_rgb_q(hq: int, sq: int, vq: int) -> tuple[float, float, float]:
+    """``hsv_to_rgb`` on 1-degree hue and 1/64 saturation/value buckets."""
+    return hsv_to_rgb(float(hq), sq / 64.0, vq / 64.0)
+
+
+@functools.lru_cache(maxsize=4096)
+def _rgb_u8_q(hq: int, sq: int, vq: int) -> np.ndarray:
+    """Read-only uint8 RGB for the same buckets as ``_hsv_to_rgb_q``."""
+    rgb = np.clip(np.asarray(_hsv_to_rgb_q(hq, sq, vq)) * 255, 0, 255).astype(np.uint8)
+    rgb.flags.writeable = False
+    return rgb
+
+
+@functools.lru_cache(maxsize=128)
+def _alpha(dt: float, tau: float) -> float:
+    """Smoothing factor of a first-order low-pass with time constant ``tau`` over ``dt``."""
+    return 1.0 - _EXP(-dt / tau)
 
 
 @dataclass
@@ -44,30 +84,91 @@ class TemporalFilter:
     tau_d: float = 1.2
     max_step: float = 0.25
     state: VAD = (0.0, 0.0, 0.0)
+    _alphas_key: tuple[float, ...] = field(default=(), init=False, repr=False, compare=False)
+    _alphas: VAD = field(default=(0.0, 0.0, 0.0), init=False, repr=False, compare=False)
+
+    def _alphas_for(self, dt: float) -> VAD:
+        # Recomputed only when dt or a time constant changes.
+        key = (dt, self.tau_v, self.tau_a, self.tau_d)
+        if key != self._alphas_key:
+            self._alphas = (_alpha(dt, self.tau_v), _alpha(dt, self.tau_a), _alpha(dt, self.tau_d))
+            self._alphas_key = key
+        return self._alphas
 
     def update(self, target: VAD, dt: float) -> VAD:
-        current = list(self.state)
-        tau = (self.tau_v, self.tau_a, self.tau_d)
-        out: list[float] = []
-        for i, (cur, t, axis_tau) in enumerate(zip(current, target, tau)):
-            alpha = 1 - math.exp(-dt / axis_tau)
-            bounded_target = cur + clamp(t - cur, -self.max_step, self.max_step)
-            nxt = lerp(cur, bounded_target, alpha)
-            out.append(clamp(nxt, -1.0, 1.0))
-        self.state = (out[0], out[1], out[2])
+        av, aa, ad = self._alphas_for(dt)
+        step = self.max_step
+        s0, s1, s2 = self.state
+        t0, t1, t2 = target
+
+        s0 = max(-1.0, min(1.0, s0 + max(-step, min(step, t0 - s0)) * av))
+        s1 = max(-1.0, min(1.0, s1 + max(-step, min(step, t1 - s1)) * aa))
+        s2 = max(-1.0, min(1.0, s2 + max(-step, min(step, t2 - s2)) * ad))
+        self.state = (s0, s1, s2)
         return self.state
 
 
+_Q15 = 32768
+
+
+@njit(cache=True)
+def _q15_axis(s, target, alpha_q, step_q):
+    t = min(max(int(round(target * 32768.0)), -32768), 32767)
+    delta = min(max(t - s, -step_q), step_q)
+    # Q15 multiply with round-to-nearest.
+    return min(max(s + ((delta * alpha_q + 16384) >> 15), -32768), 32767)
+
+
+@njit(cache=True)
+def _q15_filter_kernel(state_q, t0, t1, t2, a0, a1, a2, step_q):
+    s0 = _q15_axis(int(state_q[0]), t0, a0, step_q)
+    s1 = _q15_axis(int(state_q[1]), t1, a1, step_q)
+    s2 = _q15_axis(int(state_q[2]), t2, a2, step_q)
+    state_q[0] = s0
+    state_q[1] = s1
+    state_q[2] = s2
+    return s0 / 32768.0, s1 / 32768.0, s2 / 32768.0
+
+
+@dataclass
+class FixedPointTemporalFilter(TemporalFilter):
+    """``TemporalFilter`` that keeps its state as Q15 ``int16`` (units of 1/32768).
+
+    ``state`` decodes to floats on read and encodes on assignment.
+    """
+
+    _alphas_src: VAD | None = field(default=None, init=False, repr=False, compare=False)
+    _alphas_q: tuple[int, int, int] = field(default=(0, 0, 0), init=False, repr=False, compare=False)
+
+    @property  # type: ignore[override]
+    def state(self) -> VAD:
+        s0, s1, s2 = self.state_q.tolist()
+        return s0 / _Q15, s1 / _Q15, s2 / _Q15
+
+    @state.setter
+    def state(self, value: VAD) -> None:
+        self.state_q = np.array([min(max(round(v * _Q15), -_Q15), _Q15 - 1) for v in value], dtype=np.int16)
+
+    def update(self, target: VAD, dt: float) -> VAD:
+        alphas = self._alphas_for(dt)
+        if alphas is not self._alphas_src:
+            self._alphas_q = (round(alphas[0] * _Q15), round(alphas[1] * _Q15), round(alphas[2] * _Q15))
+            self._alphas_src = alphas
+        a0, a1, a2 = self._alphas_q
+        t0, t1, t2 = target
+        return _q15_filter_kernel(self.state_q, t0, t1, t2, a0, a1, a2, int(self.max_step * _Q15))
+
+
 @dataclass
 class EmotionEnergyModel:
     decay_per_frame: float = 0.995
     energy: float = 0.0
 
     def update(self, target: VAD, smoothed: VAD) -> float:
-        delta = sum(abs(t - s) for t, s in zip(target, smoothed)) / 3.0
-        self.energy += delta
-        self.energy *= self.decay_per_frame
-        self.energy = clamp(self.energy, 0.0, 10.0)
+        t0, t1, t2 = target
+        s0, s1, s2 = smoothed
+        energy = (self.energy + (abs(t0 - s0) + abs(t1 - s1) + abs(t2 - s2)) * _ONE_THIRD) * self.decay_per_frame
+        self.energy = max(0.0, min(10.0, energy))
         return self.energy
 
 
@@ -76,14 +177,33 @@ class Blob:
     position: list[float]
     velocity: list[float]
     radius: float
-    color: tuple[float, float, float]
-
-
-@dataclass
+    color: tuple[int, int, int]
+
+
+_VP_DTYPE = np.dtype(
+    [
+        ("turbulence", "f4"),
+        ("gravity_x", "f4"),
+        ("buoyancy", "f4"),
+        ("viscosity", "f4"),
+        ("threshold", "f4"),
+        ("surface_tension", "f4"),
+        ("blob_size_mean", "f4"),
+        ("blob_count", "i4"),
+        ("hsv_primary", "f4", (3,)),
+        ("hsv_secondary", "f4", (3,)),
+        ("rgb_primary", "f4", (3,)),
+        ("rgb_u8", "u1", (3,)),
+    ]
+)
+
+
+@dataclass(slots=True)
 class VisualParams:
     hsv_primary: tuple[float, float, float]
     hsv_secondary: tuple[float, float, float]
     rgb_primary: tuple[float, float, float]
+    rgb_u8: np.ndarray
     blob_count: int
     blob_size_mean: float
     surface_tension: float
@@ -93,12 +213,24 @@ class VisualParams:
     threshold: float
     gravity_x: float
 
+    def to_record(self) -> np.void:
+        """Pack into one contiguous ``_VP_DTYPE`` record for vectorized consumers."""
+        records = np.zeros(1, dtype=_VP_DTYPE)
+        records[0] = tuple(getattr(self, name) for name in _VP_DTYPE.names)
+        return records[0]
+
 
 @dataclass
 class VisualMapping:
     base_turbulence: float = 0.1
     arousal_gain: float = 0.9
     energy_gain: float = 0.4
+    _noise: list[float] = field(init=False, repr=False, compare=False)
+    _idx: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Fixed hue-jitter table, cycled one entry per tick; kept as a list for cheap scalar reads.
+        self._noise = np.random.default_rng(0).uniform(-24.0, 24.0, 1024).astype(np.float32).tolist()
 
     def map(self, vad: VAD, energy: float, t: float) -> VisualParams:
         v, a, d = vad
@@ -107,7 +239,8 @@ class VisualMapping:
         h = lerp(220.0, 20.0, nv)
         s = 0.3 + 0.7 * na
         val = 0.4 + 0.6 * na
-        hue_noise = random.uniform(-24.0, 24.0) * (1.0 - nd)
+        hue_noise = self._noise[self._idx & 1023] * (1.0 - nd)
+        self._idx += 1
         h2 = (h + hue_noise) % 360.0
 
         blob_count = 3 + int(na * 10)
@@ -118,17 +251,19 @@ class VisualMapping:
         turbulence = self.base_turbulence + na * self.arousal_gain + energy * self.energy_gain
         threshold = lerp(1.2, 0.9, nd)
 
-        freq = 0.1 + na * 1.5
+        omega = (0.1 + na * 1.5) * _TAU
         amp = 0.02 + energy * 0.05
-        gravity_x = math.sin(t * freq * math.tau) * amp
+        gravity_x = _SIN(t * omega) * amp
 
         hsv_primary = (h, s, val)
+        hq, sq, vq = round(h), round(s * 64), round(val * 64)
         hsv_secondary = (h2, s, val)
 
         return VisualParams(
             hsv_primary=hsv_primary,
             hsv_secondary=hsv_secondary,
-            rgb_primary=hsv_to_rgb(*hsv_primary),
+            rgb_primary=_hsv_to_rgb_q(hq, sq, vq),
+            rgb_u8=_rgb_u8_q(hq, sq, vq),
             blob_count=blob_count,
             blob_size_mean=blob_size_mean,
             surface_tension=surface_tension,
@@ -140,95 +275,402 @@ class VisualMapping:
         )
 
 
+@njit(cache=True, fastmath=True)
+def _sincos(a):
+    # Same argument side by side, so LLVM can lower the pair to a single sincos call.
+    return math.sin(a), math.cos(a)
+
+
+@njit(cache=True, fastmath=True)
+def _step_kernel(pos, vel, t, dt, turb, gx, buoy, damping, w, h):
+    # Curl noise sin(3y + p1) + sin(7y + p2), cos(3x + p3) + cos(5x + p4): the time phases are
+    # rotated in once per frame and the 3y/7y/3x/5x harmonics come from one sincos of y and of x.
+    sp1, cp1 = _sincos(1.7 * t)
+    sp2, cp2 = _sincos(-0.6 * t)
+    sp3, cp3 = _sincos(-1.3 * t)
+    sp4, cp4 = _sincos(0.8 * t)
+    for i in range(pos.shape[0]):
+        x = pos[i, 0]
+        y = pos[i, 1]
+
+        s1, c1 = _sincos(y)
+        s3 = s1 * (3.0 - 4.0 * s1 * s1)
+        c3 = c1 * (4.0 * c1 * c1 - 3.0)
+        s6 = 2.0 * s3 * c3
+        c6 = c3 * c3 - s3 * s3
+        s7 = s6 * c1 + c6 * s1
+        c7 = c6 * c1 - s6 * s1
+        nx = (s3 * cp1 + c3 * sp1 + s7 * cp2 + c7 * sp2) * 0.5
+
+        s1, c1 = _sincos(x)
+        s3 = s1 * (3.0 - 4.0 * s1 * s1)
+        c3 = c1 * (4.0 * c1 * c1 - 3.0)
+        s2 = 2.0 * s1 * c1
+        c2 = c1 * c1 - s1 * s1
+        s5 = s3 * c2 + c3 * s2
+        c5 = c3 * c2 - s3 * s2
+        ny = (c3 * cp3 - s3 * sp3 + c5 * cp4 - s5 * sp4) * 0.5
+
+        vx = (vel[i, 0] + (nx * turb + gx) * dt) * damping
+        vy = (vel[i, 1] + (ny * turb + buoy) * dt) * damping
+        vel[i, 0] = vx
+        vel[i, 1] = vy
+        pos[i, 0] = (x + vx * dt) % w
+        pos[i, 1] = min(max(y + vy * dt, 0.0), h)
+
+
+@njit(cache=True, fastmath=True)
+def _merge_kernel(pos, vel, radius, order, start, cols, rows, scale, nd, rand, removed):
+    # ``rand`` holds at least one uniform draw per candidate pair; they are consumed in order.
+    draw = 0
+    scale2 = scale * scale
+    for key in range(cols * rows):
+        if start[key] == start[key + 1]:
+            continue
+        col = key % cols
+        row = key // cols
+        for a in range(start[key], start[key + 1]):
+            i = order[a]
+            if removed[i]:
+                continue
+            xi = pos[i, 0]
+            yi = pos[i, 1]
+            ri = radius[i]
+            for r in range(max(row - 1, 0), min(row + 2, rows)):
+                for k in range(r * cols + max(col - 1, 0), r * cols + min(col + 2, cols)):
+                    for b in range(start[k], start[k + 1]):
+                        j = order[b]
+                        # Each pair is visited once, from the lower index, which absorbs the other.
+                        if j <= i or removed[j]:
+                            continue
+                        dx = xi - pos[j, 0]
+                        dy = yi - pos[j, 1]
+                        reach = ri + radius[j]
+                        if dx * dx + dy * dy < reach * reach * scale2:
+                            draw += 1
+                            if rand[draw - 1] >= nd:
+                                continue
+                            ri = math.sqrt(ri * ri + radius[j] * radius[j])
+                            radius[i] = ri
+                            vel[i, 0] = (vel[i, 0] + vel[j, 0]) * 0.5
+                            vel[i, 1] = (vel[i, 1] + vel[j, 1]) * 0.5
+                            removed[j] = True
+
+
+@njit(cache=True, fastmath=True)
+def _pair_merge_kernel(pos, vel, radius, n, scale, nd, rand, removed):
+    # All-pairs form of ``_merge_kernel`` over the first ``n`` rows, for counts too small to bucket.
+    draw = 0
+    scale2 = scale * scale
+    for i in range(n):
+        if removed[i]:
+            continue
+        xi = pos[i, 0]
+        yi = pos[i, 1]
+        ri = radius[i]
+        for j in range(i + 1, n):
+            if removed[j]:
+                continue
+            dx = xi - pos[j, 0]
+            dy = yi - pos[j, 1]
+            reach = ri + radius[j]
+            if dx * dx + dy * dy < reach * reach * scale2:
+                draw += 1
+                if rand[draw - 1] >= nd:
+                    continue
+                ri = math.sqrt(ri * ri + radius[j] * radius[j])
+                radius[i] = ri
+                vel[i, 0] = (vel[i, 0] + vel[j, 0]) * 0.5
+                vel[i, 1] = (vel[i, 1] + vel[j, 1]) * 0.5
+                removed[j] = True
+
+
+@njit(cache=True)
+def _split_kernel(pos, vel, radius, color, active, limit, na, rand, w, h):
+    # Passes over every live row, children included, until nothing splits: an oversized blob keeps
+    # halving until it drops under ``limit`` or misses a roll. Each draw is a split or a blob's one miss,
+    # so ``rand`` needs at most two per row of capacity.
+    capacity = radius.shape[0]
+    missed = np.zeros(capacity, dtype=np.bool_)
+    draw = 0
+    split = True
+    while split and active < capacity:
+        split = False
+        i = 0
+        while i < active < capacity:
+            if radius[i] > limit and not missed[i]:
+                draw += 1
+                if rand[draw - 1] >= na:
+                    missed[i] = True
+                else:
+                    r = radius[i] / math.sqrt(2.0)
+                    radius[i] = r
+                    pos[active, 0] = (pos[i, 0] + 0.03) % w
+                    pos[active, 1] = min(max(pos[i, 1] + 0.03, 0.0), h)
+                    vel[active, 0] = -vel[i, 0]
+                    vel[active, 1] = vel[i, 1]
+                    radius[active] = r
+                    color[active] = color[i]
+                    active += 1
+                    split = True
+            i += 1
+    return active
+
+
+@njit(cache=True)
+def _swap_remove_kernel(pos, vel, radius, color, removed, active):
+    # Walk from the back so the row moved into a hole is always a surviving one.
+    for j in range(removed.shape[0] - 1, -1, -1):
+        if removed[j]:
+            active -= 1
+            if j != active:
+                pos[j] = pos[active]
+                vel[j] = vel[active]
+                radius[j] = radius[active]
+                color[j] = color[active]
+    return active
+
+
+_kernels_warm = False
+
+
+def _warm_kernels() -> None:
+    global _kernels_warm
+    if _kernels_warm or not _HAVE_NUMBA:
+        return
+    pos = np.zeros((1, 2))
+    vel = np.zeros((1, 2))
+    color = np.zeros((1, 3), dtype=np.uint8)
+    rand = np.zeros(1, dtype=np.float32)
+    removed = np.zeros(1, dtype=bool)
+    _step_kernel(pos, vel, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+    _merge_kernel(pos, vel, np.ones(1), np.zeros(1, dtype=np.int64), np.array([0, 1]), 1, 1, 1.0, 0.0, rand, removed)
+    _pair_merge_kernel(pos, vel, np.ones(1), 1, 1.0, 0.0, rand, removed)
+    _split_kernel(pos, vel, np.ones(1), color, 1, 0.0, 0.0, rand, 1.0, 1.0)
+    _swap_remove_kernel(pos, vel, np.ones(1), color, removed, 1)
+    _q15_filter_kernel(np.zeros(3, dtype=np.int16), 0.0, 0.0, 0.0, 0, 0, 0, 0)
+    _kernels_warm = True
+
+
 @dataclass
 class FluidSimulation:
+    """Blob state stored as parallel fixed-capacity arrays; the first ``active`` rows are live."""
+
     width: float = 1.0
     height: float = 1.0
     damping_base: float = 0.995
-    blobs: list[Blob] = field(default_factory=list)
+    capacity: int = 64
+    _pos: np.ndarray = field(init=False, repr=False, compare=False)
+    _vel: np.ndarray = field(init=False, repr=False, compare=False)
+    _radius: np.ndarray = field(init=False, repr=False, compare=False)
+    _color: np.ndarray = field(init=False, repr=False, compare=False)
+    _active: int = field(default=0, init=False)
+    _rng: np.random.Generator = field(default_factory=np.random.default_rng, init=False, repr=False, compare=False)
+    _color_src: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._pos = np.zeros((self.capacity, 2))
+        self._vel = np.zeros((self.capacity, 2))
+        self._radius = np.zeros(self.capacity)
+        self._color = np.zeros((self.capacity, 3), dtype=np.uint8)
+        _warm_kernels()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def pos(self) -> np.ndarray:
+        return self._pos[: self._active]
+
+    @property
+    def vel(self) -> np.ndarray:
+        return self._vel[: self._active]
+
+    @property
+    def radius(self) -> np.ndarray:
+        return self._radius[: self._active]
+
+    @property
+    def color(self) -> np.ndarray:
+        return self._color[: self._active]
+
+    @property
+    def blobs(self) -> list[Blob]:
+        """Per-blob snapshot for renderers; edits are not written back."""
+        return [
+            Blob(position=p, velocity=v, radius=r, color=tuple(c))
+            for p, v, r, c in zip(self.pos.tolist(), self.vel.tolist(), self.radius.tolist(), self.color.tolist())
+        ]
 
     def reset(self, params: VisualParams, seed: int | None = None) -> None:
-        rng = random.Random(seed)
-        self.blobs = []
-        for _ in range(params.blob_count):
-            self.blobs.append(
-                Blob(
-                    position=[rng.random() * self.width, rng.random() * self.height],
-                    velocity=[rng.uniform(-0.05, 0.05), rng.uniform(-0.05, 0.05)],
-                    radius=max(0.01, rng.gauss(params.blob_size_mean, 0.015)),
-                    color=params.rgb_primary,
-                )
-            )
-
-    def _curl_noise(self, x: float, y: float, t: float) -> tuple[float, float]:
-        nx = math.sin(3.0 * y + 1.7 * t) * 0.5 + math.sin(7.0 * y - 0.6 * t) * 0.5
-        ny = math.cos(3.0 * x - 1.3 * t) * 0.5 + math.cos(5.0 * x + 0.8 * t) * 0.5
+        rng = np.random.default_rng(seed)
+        self._rng = rng
+        n = min(params.blob_count, self.capacity)
+        self._pos[:n] = rng.random((n, 2)) * (self.width, self.height)
+        self._vel[:n] = rng.uniform(-0.05, 0.05, (n, 2))
+        self._radius[:n] = np.maximum(0.01, rng.normal(params.blob_size_mean, 0.015, n))
+        self._color[:n] = params.rgb_u8
+        self._color_src = params.rgb_u8
+        self._active = n
+
+    def _append(self, pos: np.ndarray, vel: np.ndarray, radius: np.ndarray, color: np.ndarray) -> int:
+        """Write new blobs into the free slots; returns how many fit."""
+        a = self._active
+        n = min(len(radius), self.capacity - a)
+        self._pos[a : a + n] = pos[:n]
+        self._vel[a : a + n] = vel[:n]
+        self._radius[a : a + n] = radius[:n]
+        self._color[a : a + n] = color[:n]
+        self._active = a + n
+        return n
+
+    def _curl_noise(self, x: np.ndarray, y: np.ndarray, t: float) -> tuple[np.ndarray, np.ndarray]:
+        nx = np.sin(3.0 * y + 1.7 * t) * 0.5 + np.sin(7.0 * y - 0.6 * t) * 0.5
+        ny = np.cos(3.0 * x - 1.3 * t) * 0.5 + np.cos(5.0 * x + 0.8 * t) * 0.5
         return nx, ny
 
     def step(self, params: VisualParams, nd: float, na: float, dt: float, t: float) -> None:
-        if not self.blobs:
+        if not self._active:
             self.reset(params)
 
-        while len(self.blobs) < params.blob_count:
-            self.blobs.append(
-                Blob(
-                    position=[random.random() * self.width, random.random() * self.height],
-                    velocity=[0.0, 0.0],
-                    radius=params.blob_size_mean,
-                    color=params.rgb_primary,
-                )
+        missing = min(params.blob_count, self.capacity) - self._active
+        if missing > 0:
+            self._append(
+                self._rng.random((missing, 2)) * (self.width, self.height),
+                np.zeros((missing, 2)),
+                np.full(missing, params.blob_size_mean),
+                np.tile(params.rgb_u8, (missing, 1)),
             )
-        if len(self.blobs) > params.blob_count:
-            self.blobs = self.blobs[: params.blob_count]
+        elif missing < 0:
+            self._active = params.blob_count
 
         damping = self.damping_base - (1.0 - params.viscosity) * 0.02
-        for blob in self.blobs:
-            cx, cy = self._curl_noise(blob.position[0], blob.position[1], t)
-            blob.velocity[0] += (cx * params.turbulence + params.gravity_x) * dt
-            blob.velocity[1] += (cy * params.turbulence + params.buoyancy) * dt
-            blob.velocity[0] *= damping
-            blob.velocity[1] *= damping
-            blob.position[0] = (blob.position[0] + blob.velocity[0] * dt) % self.width
-            blob.position[1] = clamp(blob.position[1] + blob.velocity[1] * dt, 0.0, self.height)
-            blob.color = params.rgb_primary
+        if _HAVE_NUMBA:
+            _step_kernel(
+                self.pos, self.vel, t, dt, params.turbulence, params.gravity_x, params.buoyancy,
+                damping, self.width, self.height,
+            )
+        else:
+            self._integrate(params, damping, dt, t)
+        # The mapper hands out one cached array per colour bucket, so identity means "unchanged".
+        if params.rgb_u8 is not self._color_src:
+            self.color[:] = params.rgb_u8
+            self._color_src = params.rgb_u8
 
         self._merge_and_split(nd, na, params)
 
-    def _merge_and_split(self, nd: float, na: float, params: VisualParams) -> None:
-        i = 0
-        while i < len(self.blobs):
-            j = i + 1
-            while j < len(self.blobs):
-                a = self.blobs[i]
-                b = self.blobs[j]
-                dx = a.position[0] - b.position[0]
-                dy = a.position[1] - b.position[1]
-                dist2 = dx * dx + dy * dy
-                threshold = (a.radius + b.radius) * (1.5 - 0.5 * nd)
-                if dist2 < threshold * threshold and random.random() < nd:
-                    area = a.radius * a.radius + b.radius * b.radius
-                    a.radius = math.sqrt(area)
-                    a.velocity[0] = (a.velocity[0] + b.velocity[0]) * 0.5
-                    a.velocity[1] = (a.velocity[1] + b.velocity[1]) * 0.5
-                    self.blobs.pop(j)
+    def _integrate(self, params: VisualParams, damping: float, dt: float, t: float) -> None:
+        pos, vel = self.pos, self.vel
+        cx, cy = self._curl_noise(pos[:, 0], pos[:, 1], t)
+        vel[:, 0] += (cx * params.turbulence + params.gravity_x) * dt
+        vel[:, 1] += (cy * params.turbulence + params.buoyancy) * dt
+        vel *= damping
+        pos[:, 0] = np.mod(pos[:, 0] + vel[:, 0] * dt, self.width)
+        pos[:, 1] = np.clip(pos[:, 1] + vel[:, 1] * dt, 0.0, self.height)
+
+    def _rebuild_grid(self, cell_size: float) -> tuple[np.ndarray, np.ndarray, int, int]:
+        """Bucket blobs into square cells; returns (order, start, cols, rows).
+
+        Blobs in cell ``k`` are ``order[start[k]:start[k + 1]]``, with ``k = row * cols + col``.
+        """
+        cells = np.floor(self.pos / cell_size).astype(np.int32)
+        cols = int(math.ceil(self.width / cell_size)) + 1
+        rows = int(math.ceil(self.height / cell_size)) + 1
+        keys = cells[:, 1] * cols + cells[:, 0]
+        counts = np.bincount(keys, minlength=cols * rows)
+        start = np.zeros(cols * rows + 1, dtype=np.int64)
+        np.cumsum(counts, out=start[1:])
+        order = np.argsort(keys, kind="stable")
+        return order, start, cols, rows
+
+    def _merge_broadcast(self, nd: float, rand: np.ndarray, removed: np.ndarray) -> None:
+        """All-pairs merge test as one array expression; cheaper than the grid for small counts.
+
+        NumPy form of ``_pair_merge_kernel``: pairs are visited, and ``rand`` consumed, in the same order.
+        """
+        pos, vel, radius = self.pos, self.vel, self.radius
+        scale2 = (1.5 - 0.5 * nd) ** 2
+        diff = pos[:, None, :] - pos[None, :, :]
+        dist2 = (diff * diff).sum(axis=-1)
+        reach = radius[:, None] + radius[None, :]
+        first, second = np.nonzero(np.triu(dist2 < reach * reach * scale2, k=1))
+        rows: dict[int, list[int]] = {}
+        for i, j in zip(first.tolist(), second.tolist()):
+            rows.setdefault(i, []).append(j)
+        draw = 0
+        # Rows before ``i`` only grow themselves, so until row ``i`` absorbs something its candidates are
+        # exactly the ones found up front. Pairs come out in (i, j) order, as the kernel visits them.
+        for i, partners in rows.items():
+            if removed[i]:
+                continue
+            k = 0
+            while k < len(partners):
+                j = partners[k]
+                k += 1
+                if removed[j]:
                     continue
-                j += 1
-            i += 1
+                draw += 1
+                if rand[draw - 1] >= nd:
+                    continue
+                radius[i] = math.sqrt(radius[i] * radius[i] + radius[j] * radius[j])
+                vel[i] = (vel[i] + vel[j]) * 0.5
+                removed[j] = True
+                # The grown radius can bring later blobs of this row into reach.
+                reach = radius[i] + radius[j + 1 :]
+                partners = (j + 1 + np.flatnonzero(dist2[i, j + 1 :] < reach * reach * scale2)).tolist()
+                k = 0
 
-        idx = 0
-        while idx < len(self.blobs):
-            b = self.blobs[idx]
-            if b.radius > params.blob_size_mean * 1.8 and random.random() < na:
-                r = b.radius / math.sqrt(2)
-                b.radius = r
-                child = Blob(
-                    position=[(b.position[0] + 0.03) % self.width, clamp(b.position[1] + 0.03, 0.0, self.height)],
-                    velocity=[-b.velocity[0], b.velocity[1]],
-                    radius=r,
-                    color=b.color,
+    def _merge_and_split(self, nd: float, na: float, params: VisualParams) -> None:
+        n = self._active
+        removed = np.zeros(n, dtype=bool)
+        # One draw per possible pair for the merge, then two per row of capacity for the split kernel.
+        pairs = n * (n - 1) // 2
+        rand = self._rng.random(pairs + 2 * self.capacity, dtype=np.float32)
+        if _HAVE_NUMBA and n <= _ALL_PAIRS_MAX_BLOBS:
+            _pair_merge_kernel(self._pos, self._vel, self._radius, n, 1.5 - 0.5 * nd, nd, rand, removed)
+        elif 1 < n <= _ALL_PAIRS_MAX_BLOBS:
+            self._merge_broadcast(nd, rand, removed)
+        elif n > 1:
+            scale = 1.5 - 0.5 * nd
+            # Cells as wide as the largest possible merge distance, so only the 3x3 neighbourhood matters.
+            cell_size = max(2.0 * float(self.radius.max()) * scale, 1e-3)
+            order, start, cols, rows = self._rebuild_grid(cell_size)
+            _merge_kernel(self.pos, self.vel, self.radius, order, start, cols, rows, scale, nd, rand, removed)
+        if removed.any():
+            self._active = _swap_remove_kernel(self._pos, self._vel, self._radius, self._color, removed, n)
+
+        limit = params.blob_size_mean * 1.8
+        if _HAVE_NUMBA:
+            self._active = _split_kernel(
+                self._pos, self._vel, self._radius, self._color, self._active, limit, na, rand[pairs:],
+                self.width, self.height,
+            )
+        else:
+            self._split(limit, na)
+
+    def _split(self, limit: float, na: float) -> None:
+        """NumPy form of ``_split_kernel``; each round rolls every oversized blob that has not missed yet."""
+        missed = np.zeros(self.capacity, dtype=bool)
+        while self._active < self.capacity:
+            a = self._active
+            split = np.flatnonzero((self._radius[:a] > limit) & ~missed[:a])
+            if not len(split):
+                break
+            hit = self._rng.random(len(split)) < na
+            missed[split[~hit]] = True
+            split = split[hit][: self.capacity - a]
+            r = self._radius[split] / _SQRT2
+            self._radius[split] = r
+            parent_pos = self._pos[split]
+            child_pos = np.column_stack(
+                (
+                    np.mod(parent_pos[:, 0] + 0.03, self.width),
+                    np.clip(parent_pos[:, 1] + 0.03, 0.0, self.height),
                 )
-                self.blobs.append(child)
-            idx += 1
+            )
+            child_vel = self._vel[split] * (-1.0, 1.0)
+            self._append(child_pos, child_vel, r, self._color[split])
 
 
 @dataclass
@@ -1,6 +1,16 @@
 import math
 
-from emotion_lava_lamp import EmotionLavaLampEngine, TemporalFilter
+import numpy as np
+import pytest
+
+import emotion_lava_lamp
+from emotion_lava_lamp import (
+    EmotionLavaLampEngine,
+    FixedPointTemporalFilter,
+    FluidSimulation,
+    TemporalFilter,
+    hsv_to_rgb,
+)
 
 
 def test_temporal_filter_smooths_step_change():
@@ -35,3 +45,162 @@ def test_arousal_changes_blob_count_and_turbulence():
     assert hp.blob_count > lp.blob_count
     assert hp.turbulence > lp.turbulence
     assert all(math.isfinite(v) for v in hp.rgb_primary)
+
+
+def test_simulation_arrays_stay_aligned_and_in_bounds():
+    engine = EmotionLavaLampEngine(vad_getter=lambda: (0.5, 1.0, -0.5))
+    for _ in range(240):
+        params = engine.tick()
+
+    sim = engine.sim
+    n = len(sim.radius)
+    assert n > 0
+    assert sim.pos.shape == (n, 2) and sim.vel.shape == (n, 2) and sim.color.shape == (n, 3)
+    assert ((sim.pos[:, 0] >= 0.0) & (sim.pos[:, 0] < sim.width)).all()
+    assert ((sim.pos[:, 1] >= 0.0) & (sim.pos[:, 1] <= sim.height)).all()
+    assert sim.color.dtype == np.uint8 and (sim.color == params.rgb_u8).all()
+    assert len(sim.blobs) == n
+
+
+MERGE_PATHS = pytest.mark.parametrize(
+    "all_pairs_max, use_jit", [(0, True), (1000, True), (1000, False)], ids=["grid", "all_pairs", "all_pairs_numpy"]
+)
+
+
+@MERGE_PATHS
+def test_merge_absorbs_close_pairs_only(monkeypatch, all_pairs_max, use_jit):
+    monkeypatch.setattr(emotion_lava_lamp, "_ALL_PAIRS_MAX_BLOBS", all_pairs_max)
+    monkeypatch.setattr(emotion_lava_lamp, "_HAVE_NUMBA", use_jit)
+    sim = FluidSimulation()
+    sim._append(
+        pos=np.array([[0.10, 0.10], [0.13, 0.10], [0.90, 0.90], [0.90, 0.87]]),
+        vel=np.array([[0.1, 0.0], [-0.1, 0.0], [0.0, 0.2], [0.0, 0.0]]),
+        radius=np.full(4, 0.02),
+        color=np.full((4, 3), 255, dtype=np.uint8),
+    )
+    params = EmotionLavaLampEngine(vad_getter=lambda: None).mapper.map((0.0, 0.0, 0.0), 0.0, 0.0)
+
+    sim._merge_and_split(nd=1.0, na=0.0, params=params)
+
+    assert len(sim.radius) == 2
+    assert np.allclose(sim.radius, 0.02 * math.sqrt(2))
+    assert np.allclose(sim.vel, [[0.0, 0.0], [0.0, 0.1]])
+
+
+@MERGE_PATHS
+def test_merge_reach_grows_with_absorbed_blobs(monkeypatch, all_pairs_max, use_jit):
+    monkeypatch.setattr(emotion_lava_lamp, "_ALL_PAIRS_MAX_BLOBS", all_pairs_max)
+    monkeypatch.setattr(emotion_lava_lamp, "_HAVE_NUMBA", use_jit)
+    sim = FluidSimulation()
+    # The outer pair is out of reach until the first blob has absorbed the middle one.
+    sim._append(
+        pos=np.array([[0.100, 0.10], [0.130, 0.10], [0.145, 0.10]]),
+        vel=np.zeros((3, 2)),
+        radius=np.full(3, 0.02),
+        color=np.full((3, 3), 255, dtype=np.uint8),
+    )
+    params = EmotionLavaLampEngine(vad_getter=lambda: None).mapper.map((0.0, 0.0, 0.0), 0.0, 0.0)
+
+    sim._merge_and_split(nd=1.0, na=0.0, params=params)
+
+    assert np.allclose(sim.radius, [0.02 * math.sqrt(3)])
+
+
+def test_splits_stop_at_capacity():
+    params = EmotionLavaLampEngine(vad_getter=lambda: None).mapper.map((0.0, 1.0, 0.0), 0.0, 0.0)
+    sim = FluidSimulation(capacity=params.blob_count + 2)
+    sim.reset(params, seed=1)
+    sim.radius[:] = params.blob_size_mean * 4.0
+
+    sim._merge_and_split(nd=0.0, na=1.0, params=params)
+
+    assert sim.active == sim.capacity
+    assert np.isclose(sim.radius, params.blob_size_mean * 4.0 / math.sqrt(2)).sum() == 4
+
+
+@pytest.mark.parametrize("use_jit", [True, False], ids=["jit", "numpy"])
+def test_oversized_blob_splits_down_in_one_pass(monkeypatch, use_jit):
+    monkeypatch.setattr(emotion_lava_lamp, "_HAVE_NUMBA", use_jit)
+    params = EmotionLavaLampEngine(vad_getter=lambda: None).mapper.map((0.0, 1.0, 0.0), 0.0, 0.0)
+    sim = FluidSimulation()
+    big = params.blob_size_mean * 10.0
+    sim._append(
+        pos=np.array([[0.5, 0.5]]),
+        vel=np.zeros((1, 2)),
+        radius=np.array([big]),
+        color=np.zeros((1, 3), dtype=np.uint8),
+    )
+
+    sim._merge_and_split(nd=0.0, na=1.0, params=params)
+
+    assert sim.radius.max() < params.blob_size_mean * 1.8
+    assert sim.active == 32
+    assert np.isclose((sim.radius**2).sum(), big * big)
+
+
+def test_components_compare_by_config():
+    assert FluidSimulation() == FluidSimulation()
+    assert FluidSimulation(capacity=8) != FluidSimulation()
+
+    ticked = EmotionLavaLampEngine(vad_getter=emotion_lava_lamp.get_global_vad)
+    ticked.mapper.map((0.0, 0.0, 0.0), 0.0, 0.0)
+    assert ticked == EmotionLavaLampEngine(vad_getter=emotion_lava_lamp.get_global_vad)
+
+
+def test_jit_step_matches_numpy_integrator(monkeypatch):
+    mapper = EmotionLavaLampEngine(vad_getter=lambda: None).mapper
+    params = mapper.map((0.3, 0.8, -0.2), 0.5, 1.0)
+    jit = FluidSimulation()
+    jit.reset(params, seed=3)
+    ref = FluidSimulation()
+    ref.reset(params, seed=3)
+
+    for _ in range(30):
+        jit.step(params, nd=0.0, na=0.0, dt=0.016, t=7.3)
+    monkeypatch.setattr(emotion_lava_lamp, "_HAVE_NUMBA", False)
+    for _ in range(30):
+        ref.step(params, nd=0.0, na=0.0, dt=0.016, t=7.3)
+
+    assert np.allclose(jit.pos, ref.pos)
+    assert np.allclose(jit.vel, ref.vel)
+
+
+def test_hsv_to_rgb_primaries():
+    assert np.allclose(hsv_to_rgb(0.0, 1.0, 1.0), (1.0, 0.0, 0.0))
+    assert np.allclose(hsv_to_rgb(60.0, 1.0, 1.0), (1.0, 1.0, 0.0))
+    assert np.allclose(hsv_to_rgb(240.0, 0.5, 0.8), (0.4, 0.4, 0.8))
+    assert np.allclose(hsv_to_rgb(-30.0, 1.0, 1.0), hsv_to_rgb(330.0, 1.0, 1.0))
+
+
+def test_fixed_point_filter_tracks_float_filter():
+    ref = TemporalFilter()
+    fixed = FixedPointTemporalFilter()
+    for i in range(600):
+        target = (0.9, -0.7, 0.4) if i < 300 else (-0.5, 0.8, -0.9)
+        expected = ref.update(target, 0.016)
+        got = fixed.update(target, 0.016)
+        assert max(abs(a - b) for a, b in zip(expected, got)) < 1e-2
+
+    assert fixed.state_q.dtype == np.int16
+    fixed.state = (1.0, -1.0, 0.25)
+    assert fixed.state == (32767 / 32768, -1.0, 0.25)
+
+
+def test_params_export_to_record():
+    params = EmotionLavaLampEngine(vad_getter=lambda: None).mapper.map((1.0, 1.0, 0.0), 0.5, 0.3)
+    record = params.to_record()
+
+    assert record["blob_count"] == params.blob_count == 13
+    assert np.isclose(record["turbulence"], params.turbulence)
+    assert np.allclose(record["hsv_primary"], params.hsv_primary)
+    assert (record["rgb_u8"] == params.rgb_u8).all()
+
+
+def test_temporal_filter_picks_up_changed_time_constants():
+    filt = TemporalFilter()
+    filt.update((1.0, 1.0, 1.0), 0.016)
+    filt.tau_a = 50.0
+    filt.state = (0.0, 0.0, 0.0)
+
+    assert filt.update((1.0, 1.0, 1.0), 0.016)[1] == TemporalFilter(tau_a=50.0).update((1.0, 1.0, 1.0), 0.016)[1]
+    assert filt == TemporalFilter(tau_a=50.0, state=filt.state)